@@ -2,29 +2,46 @@
 # -*- coding: utf-8 -*-
 """
 Google Forms bot con Playwright (Python) — visible, sin capturas y con múltiples envíos
-- Chromium visible por defecto (headful) + slowmo para observar los clics.
+- Chromium visible por defecto (headful); --debug añade slowmo para observar los clics.
 - Genera respuestas según distribuciones embebidas (aprox. del Excel), con variación.
 - En checkbox selecciona >= 2 opciones (cuando aplique) y maneja exclusivas.
 - Repite el llenado/enviado N veces (por defecto 30) en un mismo navegador,
   creando un contexto/pestaña nueva por ejecución para aislar la sesión.
+- Con --concurrency C corre hasta C envíos a la vez (asyncio) en ese navegador.
 
 Requisitos:
   pip install playwright
   playwright install chromium
+  pip install numpy   # opcional: genera los lotes de respuestas vectorizados
+  pip install orjson  # opcional: lee los archivos --answers más rápido
 
 Ejemplos:
   python google_form_bot.py --url "https://docs.google.com/forms/d/e/.../viewform" --runs 30
   python google_form_bot.py --url "..." --headless --runs 5
   python google_form_bot.py --url "..." --slowmo 80 --runs 10
+  python google_form_bot.py --url "..." --debug --runs 1
+  python google_form_bot.py --url "..." --headless --answers-dir respuestas/ --concurrency 4
+  python google_form_bot.py --url "..." --headless --count 30 --concurrency 4
 """
+from __future__ import annotations
+
 import argparse
+import asyncio
+import importlib
 import json
+import math
 import random
-import time
+import re
+import unicodedata
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, List, Any, Sequence, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, Any, Sequence, Tuple
 
-from playwright.sync_api import sync_playwright, Page, Locator
+# Playwright, numpy y orjson se importan al usarse: así --help y los errores de
+# argumentos no pagan la carga de la API completa de Playwright.
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Locator, Page, Playwright
 
 # ============================================================
 # Utils
@@ -33,106 +50,284 @@ from playwright.sync_api import sync_playwright, Page, Locator
 def _log(msg: str):
     print(f"[bot] {msg}", flush=True)
 
-def wait_idle(page: Page, timeout_ms: int = 8000):
+@lru_cache(maxsize=None)
+def _optional(name: str):
+    """Importa una dependencia opcional la primera vez que se usa; None si no está."""
     try:
-        page.wait_for_load_state("networkidle", timeout=timeout_ms)
-    except Exception:
-        pass
-
-def click_next(page: Page, name: str = "Siguiente"):
-    btn = page.get_by_role("button", name=name)
-    if btn.count() == 0 and name.lower() == "siguiente":
-        btn = page.get_by_role("button", name="Next")
-    btn.first.click()
-    wait_idle(page)
-
-def click_submit(page: Page, name: str = "Enviar"):
-    btn = page.get_by_role("button", name=name)
-    if btn.count() == 0:
-        btn = page.get_by_role("button", name="Submit")
-    btn.first.click()
-    wait_idle(page)
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+def _load_json(path: Path) -> Any:
+    orjson = _optional("orjson")  # parser JSON en C
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+# Tope para esperas de elementos concretos: solo se agota si la página no llega
+# a mostrarse, así que en el camino feliz no cuesta nada.
+READY_TIMEOUT_MS = 10000
+
+# Tope para el commit de page.goto; si vence, la carga sigue y wait_question decide.
+NAV_TIMEOUT_MS = 3000
+
+# Pausa opcional entre clics para parecer humano (--human-ms). En 0 no se espera:
+# el click de Playwright ya aguarda a que el elemento sea accionable.
+HUMAN_DELAY_MS = 0
+
+async def _human_pause(page: Page):
+    if HUMAN_DELAY_MS:
+        await page.wait_for_timeout(HUMAN_DELAY_MS)
+
+# Con --strict-wait, además de la pregunta visible se espera el reposo de red
+# (networkidle) en cada página, por si se mide algo que dependa de la carga completa.
+STRICT_WAIT = False
+
+async def wait_question(page: Page, title_substr: str, timeout_ms: int = READY_TIMEOUT_MS):
+    """Espera a que la pregunta sea visible, la precondición real de la siguiente acción."""
+    await _section_by_title(page, title_substr).wait_for(state="visible", timeout=timeout_ms)
+    if STRICT_WAIT:
+        try:
+            await page.wait_for_load_state("networkidle", timeout=timeout_ms)
+        except Exception:
+            pass  # Forms mantiene pings abiertos; la pregunta ya es visible
+
+@lru_cache(maxsize=None)
+def _button_pattern(names: Tuple[str, ...]) -> re.Pattern:
+    return re.compile("|".join(re.escape(n) for n in names), re.IGNORECASE)
+
+def _button(page: Page, *names: str) -> Locator:
+    """Un solo locator para cualquiera de las etiquetas (sin sondear con count())."""
+    return page.get_by_role("button", name=_button_pattern(names)).first
+
+async def click_next(page: Page, name: str = "Siguiente", next_title: str | None = None):
+    names = (name, "Next") if name.lower() == "siguiente" else (name,)
+    await _button(page, *names).click()
+    _invalidate_q_cache(page)
+    if next_title:
+        await wait_question(page, next_title)
+
+async def click_submit(page: Page, name: str = "Enviar"):
+    # Las páginas 2 y 3 ya se sirven desde .../formResponse, así que la URL no
+    # confirma nada: el envío cuenta cuando el botón desaparece (solo la página
+    # de confirmación no lo tiene). Si no ocurre, el timeout llega al log como ERROR.
+    button = _button(page, name, "Submit")
+    await button.click()
+    _invalidate_q_cache(page)
+    await button.wait_for(state="hidden", timeout=READY_TIMEOUT_MS)
+
+# Contenedores de pregunta ya resueltos, por (id de página, título). Se invalida
+# al cambiar de página del formulario (click_next/click_submit).
+_Q_CACHE: Dict[Tuple[int, str], Locator] = {}
+
+# Índice {encabezado normalizado: contenedor} de la página actual (build_question_index).
+_Q_INDEX: Dict[int, Dict[str, Locator]] = {}
+
+def _invalidate_q_cache(page: Page):
+    pid = id(page)
+    for key in [k for k in _Q_CACHE if k[0] == pid]:
+        del _Q_CACHE[key]
+    _Q_INDEX.pop(pid, None)
+
+# XPath 1.0 no tiene lower-case(): se pliega con translate() a minúsculas sin
+# acentos, igual que _norm_title, para comparar en el mismo espacio de texto.
+_XP_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZÁÉÍÓÚÜÑáéíóúüñ"
+_XP_LOWER = "abcdefghijklmnopqrstuvwxyzaeiouunaeiouun"
+
+def _xpath_literal(text: str) -> str:
+    if '"' not in text:
+        return f'"{text}"'
+    if "'" not in text:
+        return f"'{text}'"
+    return "concat(" + ", '\"', ".join(f'"{part}"' for part in text.split('"')) + ")"
+
+@lru_cache(maxsize=None)
+def _norm_title(text: str) -> str:
+    """Espacios colapsados, casefold y sin acentos (NFKD)."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.split()).casefold()
+
+def _indexed_section(page: Page, title_substr: str) -> Locator | None:
+    """Contenedor ya conocido (caché o índice de la página), sin tocar el DOM."""
+    key = (id(page), title_substr)
+    container = _Q_CACHE.get(key)
+    if container is None:
+        needle = _norm_title(title_substr)
+        index = _Q_INDEX.get(id(page), {})
+        container = next((loc for heading, loc in index.items() if needle in heading), None)
+        if container is not None:
+            _Q_CACHE[key] = container
+    return container
 
 def _section_by_title(page: Page, title_substr: str) -> Locator:
-    candidates = page.locator('div[role="listitem"]')
-    container = candidates.filter(has=page.get_by_text(title_substr, exact=False)).first
+    container = _indexed_section(page, title_substr)
+    if container is None:
+        # Una sola consulta XPath en vez de listitem + filter(has=get_by_text(...)).
+        needle = _xpath_literal(_norm_title(title_substr))
+        text = f'translate(normalize-space(.), "{_XP_UPPER}", "{_XP_LOWER}")'
+        container = page.locator(f'xpath=//div[@role="listitem"][contains({text}, {needle})]').first
+        _Q_CACHE[(id(page), title_substr)] = container
     return container
 
-def select_radio(page: Page, question_title: str, choice_text: str):
-    cont = _section_by_title(page, question_title)
-    if cont.count() == 0:
+@lru_cache(maxsize=None)
+def _title_pattern(title_substr: str) -> re.Pattern:
+    return re.compile(re.escape(title_substr), re.IGNORECASE)
+
+async def _question_group(page: Page, role: str, title_substr: str) -> Locator | None:
+    """
+    Grupo de opciones de la pregunta. Fuera del índice se prueba primero el grupo
+    ARIA por nombre accesible (aria-labelledby del encabezado) y, si el formulario
+    no lo expone, el listitem por texto. None si no aparece.
+    """
+    cont = _indexed_section(page, title_substr)
+    if cont is None:
+        by_role = page.get_by_role(role, name=_title_pattern(title_substr)).first
+        if await by_role.count() > 0:
+            _Q_CACHE[(id(page), title_substr)] = by_role
+            return by_role
+        cont = _section_by_title(page, title_substr)
+    return cont if await cont.count() > 0 else None
+
+# Texto del encabezado de cada listitem (o del listitem entero si no tiene uno).
+_HEADINGS_JS = 'els => els.map(e => (e.querySelector(\'[role="heading"]\') || e).textContent || "")'
+
+async def build_question_index(page: Page) -> Dict[str, Locator]:
+    """
+    Recorre los listitem de la página una sola vez y guarda {encabezado: contenedor}.
+    _section_by_title resuelve después cada pregunta con una búsqueda en este dict.
+    """
+    items = page.locator('div[role="listitem"]')
+    headings = await items.evaluate_all(_HEADINGS_JS)
+    index = {_norm_title(h): items.nth(j) for j, h in enumerate(headings) if h.strip()}
+    _Q_INDEX[id(page)] = index
+    return index
+
+# Las preguntas de una página se resuelven en paralelo (asyncio.gather), pero los
+# clics se serializan: dos clics a la vez pueden desplazar la página bajo el otro.
+_CLICK_LOCKS: Dict[int, asyncio.Lock] = {}
+
+def _click_lock(page: Page) -> asyncio.Lock:
+    return _CLICK_LOCKS.setdefault(id(page), asyncio.Lock())
+
+async def select_radio(page: Page, question_title: str, choice_text: str):
+    cont = await _question_group(page, "radiogroup", question_title)
+    if cont is None:
         raise RuntimeError(f"No se encontró la pregunta (radio): {question_title}")
     radio = cont.get_by_role("radio", name=choice_text, exact=False)
-    if radio.count() == 0:
+    if await radio.count() == 0:
         radio = cont.get_by_text(choice_text, exact=False)
-    radio.first.click()
-    wait_idle(page)
+    async with _click_lock(page):
+        await radio.first.click()
+
+# Pares [aria-label, marcado] de todas las casillas de la pregunta, en una sola llamada.
+_CHECKBOX_STATES_JS = 'els => els.map(e => [e.getAttribute("aria-label") || "", e.getAttribute("aria-checked") === "true"])'
 
-def select_checkboxes(page: Page, question_title: str, choices: List[str]):
-    cont = _section_by_title(page, question_title)
-    if cont.count() == 0:
+async def _read_checkbox_states(cont: Locator, choices: List[str]) -> Dict[str, bool]:
+    pairs = await cont.locator('[role="checkbox"]').evaluate_all(_CHECKBOX_STATES_JS)
+    by_label = dict(pairs)
+    states: Dict[str, bool] = {}
+    for choice in choices:
+        if choice in by_label:
+            states[choice] = by_label[choice]
+        else:  # etiqueta con texto extra: coincidencia por contención
+            states[choice] = any(checked for label, checked in pairs if choice in label)
+    return states
+
+async def select_checkboxes(page: Page, question_title: str, choices: List[str]):
+    cont = await _question_group(page, "list", question_title)
+    if cont is None:
         raise RuntimeError(f"No se encontró la pregunta (checkbox): {question_title}")
+    # Primero se leen todos los estados y después solo se clica lo pendiente.
+    checked = await _read_checkbox_states(cont, choices)
+    pending: List[Locator] = []
     for choice in choices:
+        if checked[choice]:
+            continue
         cb = cont.get_by_role("checkbox", name=choice, exact=False)
-        if cb.count() == 0:
+        if await cb.count() == 0:
             cb = cont.get_by_text(choice, exact=False)
-        try:
-            attr = cb.first.get_attribute("aria-checked")
-            already = (attr == "true")
-        except Exception:
-            already = False
-        if not already:
-            cb.first.click()
-            time.sleep(0.2)
-    wait_idle(page)
+        pending.append(cb.first)
+    async with _click_lock(page):
+        for cb in pending:
+            await cb.click()
+            await _human_pause(page)
 
 # ============================================================
 # Matrices Likert
 # ============================================================
 
-def select_linear_scale_permutation(page: Page, group_title: str):
+# Clica la fila i de la matriz en la columna permutation[i % n] dentro del
+# navegador, en una sola llamada. Devuelve [filas, radios de la primera fila].
+_MATRIX_CLICK_JS = """
+(item, permutation) => {
+  const rows = item.querySelectorAll('div[role="radiogroup"]');
+  rows.forEach((row, i) => {
+    const radios = row.querySelectorAll('[role="radio"]');
+    const radio = radios[permutation[i % permutation.length]];
+    if (radio) radio.click();
+  });
+  return [rows.length, rows.length ? rows[0].querySelectorAll('[role="radio"]').length : 0];
+}
+"""
+
+# Columnas por matriz, por (URL de la página, título). Todas las ejecuciones de un
+# run_many ven el mismo formulario, así que se mide una vez y se valida en cada clic.
+_SCALE_LAYOUT: Dict[Tuple[str, str], int] = {}
+
+async def select_linear_scale_permutation(page: Page, group_title: str, _retry: bool = True):
     group = _section_by_title(page, group_title)
-    if group.count() == 0:
+    if await group.count() == 0:
         raise RuntimeError(f"No se encontró el bloque de escala lineal: {group_title}")
 
-    rows = group.locator('div[role="radiogroup"]')
-    row_count = rows.count()
-    if row_count == 0:
-        raise RuntimeError(f"No se detectaron filas en la matriz: {group_title}")
-
-    col_count = rows.nth(0).get_by_role("radio").count()
-    if col_count == 0:
-        raise RuntimeError(f"No se detectaron columnas (radios) en la matriz: {group_title}")
+    key = (page.url, group_title)
+    col_count = _SCALE_LAYOUT.get(key)
+    if col_count is None:
+        rows = group.locator('div[role="radiogroup"]')
+        col_count = await rows.first.get_by_role("radio").count()
+        if col_count == 0:
+            raise RuntimeError(f"No se detectaron columnas (radios) en la matriz: {group_title}")
+        _SCALE_LAYOUT[key] = col_count
 
     columns = list(range(col_count))
     random.shuffle(columns)
 
-    for i in range(row_count):
-        col_index = columns[i % col_count]
-        row = rows.nth(i)
-        row.scroll_into_view_if_needed(timeout=5000)
-        row.get_by_role("radio").nth(col_index).click(timeout=15000)
-        time.sleep(0.12)
-    wait_idle(page)
-
-def select_linear_scale_from_dict(page: Page, group_title: str, rows_to_values: Dict[str, int]):
+    row_count, seen_cols = await group.evaluate(_MATRIX_CLICK_JS, columns)
+    if row_count == 0:
+        raise RuntimeError(f"No se detectaron filas en la matriz: {group_title}")
+    if seen_cols != col_count:
+        # Disposición en caché obsoleta: se vuelve a medir y se repite una vez.
+        _SCALE_LAYOUT.pop(key, None)
+        if not _retry:
+            raise RuntimeError(f"La matriz cambió de columnas durante el llenado: {group_title}")
+        await select_linear_scale_permutation(page, group_title, _retry=False)
+
+async def select_linear_scale_from_dict(page: Page, group_title: str, rows_to_values: Dict[str, int]):
     group = _section_by_title(page, group_title)
-    if group.count() == 0:
+    if await group.count() == 0:
         raise RuntimeError(f"No se encontró el bloque de escala lineal: {group_title}")
 
+    # Filas, etiquetas y radios se resuelven una sola vez; luego se clica sobre
+    # los handles sin volver a consultar el DOM por cada fila.
+    rows = group.locator('div[role="radiogroup"]')
+    labels = await rows.evaluate_all('els => els.map(e => e.getAttribute("aria-label") || e.textContent || "")')
+    row_radios = [await rh.query_selector_all('[role="radio"]') for rh in await rows.element_handles()]
+
     for row_text, value in rows_to_values.items():
-        row = group.locator('div[role="radiogroup"]').filter(
-            has=group.get_by_text(row_text, exact=False)
-        ).first
-        if row.count() == 0:
+        i = next((j for j, label in enumerate(labels) if row_text in label), None)
+        if i is None or not row_radios[i]:
+            # Fallback: la etiqueta de la fila no está dentro del radiogroup.
             row = group.locator('div').filter(has=group.get_by_text(row_text, exact=False)).first
-        row.scroll_into_view_if_needed(timeout=5000)
-        radios = row.get_by_role("radio")
-        col_count = radios.count()
-        idx = max(0, min(value - 1, col_count - 1))
-        radios.nth(idx).click(timeout=15000)
-        time.sleep(0.12)
-    wait_idle(page)
+            await row.scroll_into_view_if_needed(timeout=5000)
+            radios = row.get_by_role("radio")
+            col_count = await radios.count()
+            idx = max(0, min(value - 1, col_count - 1))
+            await radios.nth(idx).click(timeout=15000)
+        else:
+            radios = row_radios[i]
+            idx = max(0, min(value - 1, len(radios) - 1))
+            await radios[idx].click(timeout=15000)
+        await _human_pause(page)
 
 # ============================================================
 # Catálogo y PESOS (probabilidades) embebidos
@@ -198,203 +393,510 @@ def _normalize(weights: Dict[str, float]) -> List[Tuple[str, float]]:
         return [(k, 1.0 / n) for k, _ in items]
     return [(k, w / s) for k, w in items]
 
-def weighted_choice(options: Sequence[str], weights_map: Dict[str, float]) -> str:
-    items = _normalize({opt: weights_map.get(opt, 0.0) for opt in options})
-    choices, probs = zip(*items)
-    r = random.random(); acc = 0.0
-    for choice, p in zip(choices, probs):
-        acc += p
-        if r <= acc:
-            return choice
-    return choices[-1]
-
-def weighted_sample_unique(options: Sequence[str], weights_map: Dict[str, float], k: int) -> List[str]:
+# Tablas (opciones, probabilidades acumuladas) por firma (opciones, pesos), para
+# no renormalizar el mismo mapa de pesos en cada muestra.
+_CDF: Dict[Tuple[Tuple[str, ...], Tuple[float, ...]], Tuple[Tuple[str, ...], Tuple[float, ...]]] = {}
+
+def _cdf_table(options: Sequence[str], weights_map: Dict[str, float]) -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
+    opts = tuple(options)
+    weights = tuple(weights_map.get(opt, 0.0) for opt in opts)
+    key = (opts, weights)
+    table = _CDF.get(key)
+    if table is None:
+        choices, probs = zip(*_normalize(dict(zip(opts, weights))))
+        table = (choices, tuple(accumulate(probs)))
+        _CDF[key] = table
+    return table
+
+def _sample_unique_weights(options: Sequence[str], weights: Sequence[float], k: int, rng=random) -> List[str]:
+    # Efraimidis-Spirakis: clave log(u)/w por opción y se toman las k mayores.
+    # Equivale a extraer sin reemplazo, pero en una sola pasada. Pesos nulos o
+    # negativos se acotan a 1e-12: quedan al final, pero sin dividir entre cero.
     k = max(0, min(k, len(options)))
-    remaining = list(options)
-    selected: List[str] = []
-    for _ in range(k):
-        if not remaining:
-            break
-        pick = weighted_choice(remaining, weights_map)
-        selected.append(pick)
-        remaining.remove(pick)
-    return selected
-
-def random_k_for_checkbox(min_k: int, max_k: int) -> int:
-    return int(round(random.triangular(min_k, max_k, min_k)))
+    keys = [(math.log(1.0 - rng.random()) / max(float(w), 1e-12), opt) for opt, w in zip(options, weights)]
+    keys.sort(key=lambda kv: kv[0], reverse=True)
+    return [opt for _, opt in keys[:k]]
+
+def weighted_sample_unique(options: Sequence[str], weights_map: Dict[str, float], k: int, rng=random) -> List[str]:
+    return _sample_unique_weights(options, [weights_map.get(opt, 0.0) for opt in options], k, rng)
+
+def random_k_for_checkbox(min_k: int, max_k: int, rng=random) -> int:
+    return int(round(rng.triangular(min_k, max_k, min_k)))
 
 # ============================================================
 # Generador de respuestas
 # ============================================================
 
-def build_prob_answers() -> Dict[str, Any]:
-    # Página 1
-    semestre = weighted_choice(OPTS["semestre"], WEIGHTS["semestre"])
+def _build_prob_spec() -> Dict[str, Dict[str, Tuple]]:
+    """
+    Distribuciones fijas por página y campo, armadas una sola vez al importar:
+    ("one", opciones, acumuladas) para radios, ("many", opciones, pesos, min_k, max_k,
+    exclusiva, p_exclusiva) para casillas y ("const", valor) para valores fijos.
+    """
+    def one(key: str) -> Tuple:
+        return ("one",) + _cdf_table(OPTS[key], WEIGHTS[key])
+
+    def many(key: str, options: Sequence[str], min_k: int, max_k: int, exclusive: str | None = None, p_exclusive: float = 0.0) -> Tuple:
+        weights = tuple(max(float(WEIGHTS[key].get(opt, 0.0)), 1e-12) for opt in options)
+        return ("many", tuple(options), weights, min_k, min(max_k, len(options)), exclusive, p_exclusive)
+
+    herramientas = [h for h in OPTS["herramientas"] if h != "Ninguno"]
+    return {
+        "page1": {
+            "semestre": one("semestre"),
+            "herramientas": many("herramientas", herramientas, 2, 4, "Ninguno", WEIGHTS["herramientas"].get("Ninguno", 0.03)),
+            "so_virtualizados": many("so_virtualizados_main", OPTS["so_virtualizados_main"], 2, 3, "No uso virtualización", P_NO_VIRTUALIZA),
+            "impedimentos": many("impedimentos_main", OPTS["impedimentos_main"], 2, 3),
+        },
+        "page2": {
+            "tipo_equipo": one("tipo_equipo"),
+            "cpu": one("cpu"),
+            "ram": one("ram"),
+            "tipo_almacenamiento": one("tipo_almacenamiento"),
+            "capacidad_almacenamiento": one("capacidad"),
+            "gpu": one("gpu"),
+        },
+        "page3": {
+            "preferencia": one("preferencia"),
+            "beneficios_permutar": ("const", True),
+            "preocupaciones_permutar": ("const", True),
+        },
+    }
 
-    if random.random() < WEIGHTS["herramientas"].get("Ninguno", 0.03):
-        herramientas = ["Ninguno"]
-    else:
-        pool = [h for h in OPTS["herramientas"] if h != "Ninguno"]
-        k = random_k_for_checkbox(2, min(4, len(pool)))
-        herramientas = weighted_sample_unique(pool, WEIGHTS["herramientas"], k)
+def _sample(spec: Dict[str, Dict[str, Tuple]], rng) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for page, fields in spec.items():
+        values: Dict[str, Any] = {}
+        for field, (kind, *args) in fields.items():
+            if kind == "one":
+                choices, cum = args
+                values[field] = rng.choices(choices, cum_weights=cum)[0]
+            elif kind == "many":
+                options, weights, min_k, max_k, exclusive, p_exclusive = args
+                if exclusive is not None and rng.random() < p_exclusive:
+                    values[field] = [exclusive]
+                    continue
+                k = random_k_for_checkbox(min_k, max_k, rng)
+                values[field] = _sample_unique_weights(options, weights, k, rng)
+            else:
+                values[field] = args[0]
+        out[page] = values
+    return out
 
-    if random.random() < P_NO_VIRTUALIZA:
-        so_virtualizados = ["No uso virtualización"]
-    else:
-        pool = OPTS["so_virtualizados_main"]
-        k = random_k_for_checkbox(2, min(3, len(pool)))
-        so_virtualizados = weighted_sample_unique(pool, WEIGHTS["so_virtualizados_main"], k)
-
-    imp_pool = OPTS["impedimentos_main"]
-    k_imp = random_k_for_checkbox(2, min(3, len(imp_pool)))
-    impedimentos = weighted_sample_unique(imp_pool, WEIGHTS["impedimentos_main"], k_imp)
-
-    page1 = {
-        "semestre": semestre,
-        "herramientas": herramientas,
-        "so_virtualizados": so_virtualizados,
-        "impedimentos": impedimentos,
-    }
+_PROB_SPEC = _build_prob_spec()
 
-    # Página 2
-    page2 = {
-        "tipo_equipo": weighted_choice(OPTS["tipo_equipo"], WEIGHTS["tipo_equipo"]),
-        "cpu": weighted_choice(OPTS["cpu"], WEIGHTS["cpu"]),
-        "ram": weighted_choice(OPTS["ram"], WEIGHTS["ram"]),
-        "tipo_almacenamiento": weighted_choice(OPTS["tipo_almacenamiento"], WEIGHTS["tipo_almacenamiento"]),
-        "capacidad_almacenamiento": weighted_choice(OPTS["capacidad"], WEIGHTS["capacidad"]),
-        "gpu": weighted_choice(OPTS["gpu"], WEIGHTS["gpu"]),
-    }
+def build_prob_answers() -> Dict[str, Any]:
+    return _sample(_PROB_SPEC, random)
 
-    # Página 3
-    page3 = {
-        "preferencia": weighted_choice(OPTS["preferencia"], WEIGHTS["preferencia"]),
-        "beneficios_permutar": True,
-        "preocupaciones_permutar": True,
-    }
+def _np_sample_unique(rng, options: Sequence[str], weights: Sequence[float], min_k: int, max_k: int, n: int) -> List[List[str]]:
+    # Efraimidis-Spirakis vectorizado: claves log(u)/w de (n, m) y top-k por fila.
+    np = _optional("numpy")
+    keys = np.log1p(-rng.random((n, len(options)))) / np.asarray(weights)
+    order = np.argsort(-keys, axis=1)
+    ks = np.rint(rng.triangular(min_k, min_k, max_k, size=n)).astype(int) if max_k > min_k else np.full(n, min_k)
+    return [[options[j] for j in order[i, :ks[i]]] for i in range(n)]
 
-    return {"page1": page1, "page2": page2, "page3": page3}
+def build_prob_answers_batch(n: int) -> List[Dict[str, Any]]:
+    """
+    Igual que n llamadas a build_prob_answers(), pero vectorizado con NumPy sobre
+    _PROB_SPEC: todos los radios salen de una sola matriz uniforme (n, campos).
+    Sin NumPy instalado cae al bucle de build_prob_answers().
+    """
+    np = _optional("numpy")
+    if np is None:
+        return [build_prob_answers() for _ in range(n)]
+    rng = np.random.default_rng(random.getrandbits(64))  # reproducible con --seed
+
+    fields = [(page, field, kind, args) for page, spec in _PROB_SPEC.items() for field, (kind, *args) in spec.items()]
+    radios = [f for f in fields if f[2] == "one"]
+    u = rng.random((n, len(radios)))
+    columns: Dict[Tuple[str, str], List[Any]] = {}
+    for j, (page, field, _, (choices, cum)) in enumerate(radios):
+        idx = np.minimum(np.searchsorted(cum, u[:, j] * cum[-1], side="right"), len(choices) - 1)
+        columns[page, field] = [choices[i] for i in idx]
+    for page, field, kind, args in fields:
+        if kind == "many":
+            options, weights, min_k, max_k, exclusive, p_exclusive = args
+            picks = _np_sample_unique(rng, options, weights, min_k, max_k, n)
+            if exclusive is not None:
+                for i in np.flatnonzero(rng.random(n) < p_exclusive):
+                    picks[i] = [exclusive]
+            columns[page, field] = picks
+        elif kind == "const":
+            columns[page, field] = [args[0]] * n
+
+    return [
+        {page: {field: columns[page, field][i] for field in spec} for page, spec in _PROB_SPEC.items()}
+        for i in range(n)
+    ]
 
 # ============================================================
 # Relleno y envío (una ejecución)
 # ============================================================
 
-def _fill_and_submit(page: Page, answers: Dict[str, Any]):
-    page.goto(url=answers["_url"], wait_until="domcontentloaded")
-    wait_idle(page)
-
-    # === PAGE 1 ===
-    p1 = answers.get("page1", {})
-    if p1:
-        if "semestre" in p1:
-            select_radio(page, "¿En qué semestre te encuentras?", p1["semestre"])
-
-        if "herramientas" in p1 and isinstance(p1["herramientas"], list):
-            select_checkboxes(page, "¿Qué herramientas usas hoy para prácticas?", p1["herramientas"])
-
-        if "so_virtualizados" in p1 and isinstance(p1["so_virtualizados"], list):
-            select_checkboxes(page, "¿Qué sistemas operativos virtualizas en tu equipo personal?", p1["so_virtualizados"])
-
-        if "impedimentos" in p1 and isinstance(p1["impedimentos"], list):
-            select_checkboxes(page, "¿qué es lo que falla o te impide usarlos correctamente en tu equipo personal?", p1["impedimentos"])
-
-    click_next(page, "Siguiente")
-
-    # === PAGE 2 ===
-    p2 = answers.get("page2", {})
-    if p2:
-        if "tipo_equipo" in p2:
-            select_radio(page, "¿Qué tipo de equipo utilizar", p2["tipo_equipo"])
-
-        if "cpu" in p2:
-            select_radio(page, "¿Con qué procesador cuenta tu equipo", p2["cpu"])
-
-        if "ram" in p2:
-            select_radio(page, "¿Con cuánta memoria RAM", p2["ram"])
+# Marca en el navegador todas las radios/casillas de una página en una sola
+# llamada. Devuelve los índices de 'spec' que no pudo completar.
+_BATCH_FILL_JS = r"""
+(spec) => {
+  const norm = s => s.normalize("NFKD").replace(/[\u0300-\u036f]/g, "").replace(/\s+/g, " ").trim().toLowerCase();
+  const items = Array.from(document.querySelectorAll('div[role="listitem"]')).map(el => {
+    const h = el.querySelector('[role="heading"]') || el;
+    return [norm(h.textContent || ""), el];
+  });
+  const failed = [];
+  spec.forEach((item, i) => {
+    const found = items.find(([heading]) => heading.includes(item.question));
+    if (!found) { failed.push(i); return; }
+    const inputs = Array.from(found[1].querySelectorAll(`[role="${item.kind}"]`));
+    let ok = true;
+    for (const value of item.values) {
+      const input = inputs.find(e => (e.getAttribute("aria-label") || e.getAttribute("data-value") || "").includes(value));
+      if (!input) { ok = false; continue; }
+      if (input.getAttribute("aria-checked") !== "true") input.click();
+    }
+    if (!ok) failed.push(i);
+  });
+  return failed;
+}
+"""
 
-        if "tipo_almacenamiento" in p2:
-            select_radio(page, "¿Cuál es el tipo de almacenamiento principal", p2["tipo_almacenamiento"])
+async def batch_fill(page: Page, spec: List[Dict[str, Any]]) -> List[int]:
+    """
+    spec: [{"question", "kind": "radio"|"checkbox", "values": [...]}, ...].
+    Un solo page.evaluate para toda la lista; devuelve los índices a reintentar.
+    """
+    if not spec:
+        return []
+    payload = [{**item, "question": _norm_title(item["question"])} for item in spec]
+    try:
+        return await page.evaluate(_BATCH_FILL_JS, payload)
+    except Exception:
+        return list(range(len(spec)))
+
+# Esquema declarativo del formulario: (página, tipo, título, clave en answers["pageN"]).
+SCHEMA: List[Tuple[int, str, str, str]] = [
+    (1, "radio", "¿En qué semestre te encuentras?", "semestre"),
+    (1, "checkbox", "¿Qué herramientas usas hoy para prácticas?", "herramientas"),
+    (1, "checkbox", "¿Qué sistemas operativos virtualizas en tu equipo personal?", "so_virtualizados"),
+    (1, "checkbox", "¿qué es lo que falla o te impide usarlos correctamente en tu equipo personal?", "impedimentos"),
+    (2, "radio", "¿Qué tipo de equipo utilizar", "tipo_equipo"),
+    (2, "radio", "¿Con qué procesador cuenta tu equipo", "cpu"),
+    (2, "radio", "¿Con cuánta memoria RAM", "ram"),
+    (2, "radio", "¿Cuál es el tipo de almacenamiento principal", "tipo_almacenamiento"),
+    (2, "radio", "¿Cuál es la capacidad total de memoria principal aproximada", "capacidad_almacenamiento"),
+    (2, "radio", "¿Con qué tipo de gráficos cuenta tu equipo principal", "gpu"),
+    (3, "radio", "¿Prefieres utilizar un servicio", "preferencia"),
+    (3, "scale", "¿Qué beneficios considera más importantes", "beneficios"),
+    (3, "scale", "¿Qué preocupaciones le genera el uso", "preocupaciones"),
+]
+
+SCHEMA_PAGES: List[List[Tuple[int, str, str, str]]] = [
+    [entry for entry in SCHEMA if entry[0] == n] for n in sorted({entry[0] for entry in SCHEMA})
+]
+
+async def _answer_question(page: Page, kind: str, title: str, key: str, section: Dict[str, Any]):
+    if kind == "radio":
+        if key in section:
+            await select_radio(page, title, section[key])
+    elif kind == "checkbox":
+        if isinstance(section.get(key), list):
+            await select_checkboxes(page, title, section[key])
+    elif kind == "scale":
+        if not section.get(f"{key}_permutar", True) and isinstance(section.get(key), dict):
+            await select_linear_scale_from_dict(page, title, section[key])
+        else:
+            await select_linear_scale_permutation(page, title)
+    else:
+        raise ValueError(f"Tipo de pregunta desconocido en SCHEMA: {kind}")
 
-        if "capacidad_almacenamiento" in p2:
-            select_radio(page, "¿Cuál es la capacidad total de memoria principal aproximada", p2["capacidad_almacenamiento"])
+async def _fill_and_submit(page: Page, answers: Dict[str, Any]):
+    # Basta con que la navegación haga commit: la señal real de "listo" es que la
+    # primera pregunta sea visible, sin esperar el parseo completo ni trackers.
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-        if "gpu" in p2:
-            select_radio(page, "¿Con qué tipo de gráficos cuenta tu equipo principal", p2["gpu"])
+    try:
+        await page.goto(url=answers["_url"], wait_until="commit", timeout=NAV_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        pass
+    await wait_question(page, SCHEMA_PAGES[0][0][2])
+
+    for n, entries in enumerate(SCHEMA_PAGES):
+        # Un solo recorrido de los listitem por página en lugar de uno por pregunta.
+        await build_question_index(page)
+        section = answers.get(f"page{entries[0][0]}", {})
+        if section:
+            fields = [(kind, title, key) for _, kind, title, key in entries if kind != "scale"]
+            # Sin pausas humanas, radios y casillas se marcan en un solo evaluate;
+            # lo que falle vuelve por el camino de Playwright.
+            if not HUMAN_DELAY_MS:
+                wanted = [
+                    (kind, title, key) for kind, title, key in fields
+                    if (kind == "radio" and key in section) or (kind == "checkbox" and isinstance(section.get(key), list))
+                ]
+                spec = [
+                    {"question": title, "kind": kind, "values": section[key] if kind == "checkbox" else [section[key]]}
+                    for kind, title, key in wanted
+                ]
+                failed = await batch_fill(page, spec)
+                fields = [wanted[i] for i in failed]
+
+            # Radios y casillas son independientes: se lanzan juntos. Las escalas
+            # van después y en orden, para que --seed reproduzca sus permutaciones.
+            results = await asyncio.gather(
+                *(_answer_question(page, kind, title, key, section) for kind, title, key in fields),
+                return_exceptions=True,
+            )
+            for res in results:
+                if isinstance(res, BaseException):
+                    raise res
+            for _, kind, title, key in entries:
+                if kind == "scale":
+                    await _answer_question(page, kind, title, key, section)
+
+        if n + 1 < len(SCHEMA_PAGES):
+            await click_next(page, "Siguiente", next_title=SCHEMA_PAGES[n + 1][0][2])
+
+    await click_submit(page, "Enviar")
 
-    click_next(page, "Siguiente")
+# ============================================================
+# Runner múltiples ejecuciones en un mismo navegador
+# ============================================================
 
-    # === PAGE 3 ===
-    p3 = answers.get("page3", {})
-    if p3:
-        if "preferencia" in p3:
-            select_radio(page, "¿Prefieres utilizar un servicio", p3["preferencia"])
+CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+]
+
+# Recursos que el bot nunca necesita para responder el formulario.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+# Con --lean se bloquean además hojas de estilo y telemetría: la selección usa
+# roles ARIA, no CSS, así que el formulario sigue respondiendo igual.
+LEAN_MODE = False
+LEAN_RESOURCE_TYPES = {"stylesheet"}
+ANALYTICS_URL_PARTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net", "play.google.com/log")
+
+def _is_blocked(resource_type: str, url: str) -> bool:
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    if LEAN_MODE:
+        return resource_type in LEAN_RESOURCE_TYPES or any(part in url for part in ANALYTICS_URL_PARTS)
+    return False
+
+async def _block_heavy_resources(route):
+    if _is_blocked(route.request.resource_type, route.request.url):
+        await route.abort()
+    else:
+        await route.continue_()
 
-        if p3.get("beneficios_permutar", True):
-            select_linear_scale_permutation(page, "¿Qué beneficios considera más importantes")
-        else:
-            if isinstance(p3.get("beneficios"), dict):
-                select_linear_scale_from_dict(page, "¿Qué beneficios considera más importantes", p3["beneficios"])
-            else:
-                select_linear_scale_permutation(page, "¿Qué beneficios considera más importantes")
+# En headless no se pinta nada en pantalla: un lienzo menor abarata el layout de
+# cada clic. main() elige uno u otro según --headless (o --viewport WxH).
+HEADFUL_VIEWPORT = {"width": 1280, "height": 720}
+HEADLESS_VIEWPORT = {"width": 800, "height": 600}
+VIEWPORT = HEADFUL_VIEWPORT
 
-        if p3.get("preocupaciones_permutar", True):
-            select_linear_scale_permutation(page, "¿Qué preocupaciones le genera el uso")
-        else:
-            if isinstance(p3.get("preocupaciones"), dict):
-                select_linear_scale_from_dict(page, "¿Qué preocupaciones le genera el uso", p3["preocupaciones"])
-            else:
-                select_linear_scale_permutation(page, "¿Qué preocupaciones le genera el uso")
+# Chromium calientes que se reutilizan entre envíos (--pool-size) y se reciclan
+# tras MAX_USES_PER_INSTANCE contextos para no arrastrar memoria indefinidamente.
+POOL_SIZE = 1
+MAX_USES_PER_INSTANCE = 50
 
-    click_submit(page, "Enviar")
-    wait_idle(page)
+class _BrowserPool:
+    """
+    Reparte contextos entre hasta 'size' navegadores: usa uno libre, abre otro
+    si todos están ocupados y hay hueco, y si no, el menos cargado.
+    """
 
-# ============================================================
-# Runner múltiples ejecuciones en un mismo navegador
-# ============================================================
+    def __init__(self, p: Playwright, size: int = POOL_SIZE, max_uses: int = MAX_USES_PER_INSTANCE, **launch_kwargs: Any):
+        self._p = p
+        self._size = max(1, size)
+        self._max_uses = max(1, max_uses)
+        self._launch_kwargs = launch_kwargs
+        self._entries: List[Dict[str, Any]] = []  # {"browser", "active", "uses"}
+        self._lock = asyncio.Lock()
+
+    async def _launch(self) -> Dict[str, Any]:
+        browser = await self._p.chromium.launch(args=CHROMIUM_ARGS, **self._launch_kwargs)
+        entry = {"browser": browser, "active": 0, "uses": 0}
+        self._entries.append(entry)
+        return entry
+
+    async def warm(self):
+        """Lanza el primer navegador por adelantado, sin contarlo como uso."""
+        async with self._lock:
+            if not self._entries:
+                await self._launch()
+
+    async def acquire(self) -> Browser:
+        async with self._lock:
+            usable = [e for e in self._entries if e["uses"] < self._max_uses]
+            entry = min(usable, key=lambda e: e["active"], default=None)
+            if (entry is None or entry["active"] > 0) and len(usable) < self._size:
+                entry = await self._launch()
+            entry["active"] += 1
+            entry["uses"] += 1
+            return entry["browser"]
+
+    async def release(self, browser: Browser):
+        async with self._lock:
+            entry = next(e for e in self._entries if e["browser"] is browser)
+            entry["active"] -= 1
+            if entry["uses"] >= self._max_uses and entry["active"] == 0:
+                self._entries.remove(entry)
+                await browser.close()
+
+    async def close(self):
+        async with self._lock:
+            for entry in self._entries:
+                await entry["browser"].close()
+            self._entries.clear()
+
+async def open_session(headless: bool = False, slowmo: int = 0, pool_size: int = POOL_SIZE) -> Tuple[Playwright, _BrowserPool]:
+    """Arranca Playwright y calienta el primer Chromium del pool."""
+    from playwright.async_api import async_playwright
+
+    p = await async_playwright().start()
+    pool = _BrowserPool(p, size=pool_size, headless=headless, slow_mo=slowmo)
+    try:
+        await pool.warm()
+    except BaseException:
+        await p.stop()  # p. ej. Chromium no instalado: no dejar el driver vivo
+        raise
+    return p, pool
+
+async def close_session(p: Playwright, pool: _BrowserPool):
+    await pool.close()
+    await p.stop()
+
+async def submit_once(browser: Browser, url: str, answers: Dict[str, Any]):
+    """Llena y envía una vez en un contexto nuevo (sin cookies previas); solo cierra el contexto."""
+    ctx = await browser.new_context(viewport=VIEWPORT, device_scale_factor=1, is_mobile=False, service_workers="block")
+    page = None
+    try:
+        await ctx.route("**/*", _block_heavy_resources)
+        page = await ctx.new_page()
+        await _fill_and_submit(page, {**answers, "_url": url})
+    finally:
+        try:
+            if page is not None:
+                _invalidate_q_cache(page)
+                _CLICK_LOCKS.pop(id(page), None)
+                await page.close()
+        finally:
+            await ctx.close()  # siempre, aunque route/new_page o page.close fallen
+
+async def run_bot_async(pool: _BrowserPool, url: str, i: int, runs: int, answers: Dict[str, Any] | Path, jitter_s: float = 0.8):
+    """Un envío completo (con log) sobre un navegador del pool."""
+    try:
+        _log(f"Iteración {i}/{runs}: llenando y enviando…")
+        if isinstance(answers, Path):
+            # Un archivo inválido solo cuesta su propio envío, no toda la corrida.
+            answers = _load_json(answers)
+        browser = await pool.acquire()
+        try:
+            await submit_once(browser, url, answers)
+        finally:
+            await pool.release(browser)
+        _log(f"Iteración {i}/{runs}: enviada ✅")
+    except Exception as e:
+        _log(f"Iteración {i}/{runs}: ERROR -> {e}")
+    finally:
+        # pequeño respiro aleatorio para no spamear al servidor
+        await asyncio.sleep(random.uniform(0.2, jitter_s))
+
+# Tamaño de cada lote NumPy cuando las respuestas se generan bajo demanda.
+ANSWER_CHUNK = 64
+
+def iter_answers(runs: int, answers_static: Dict[str, Any] | None = None, answer_files: Sequence[Path] | None = None) -> Iterator[Dict[str, Any] | Path]:
+    """
+    Genera las respuestas de forma perezosa, en lotes de ANSWER_CHUNK. Con
+    'answer_files' entrega las rutas tal cual: cada worker lee la suya.
+    """
+    if answer_files is not None:
+        yield from answer_files
+        return
+    if answers_static is not None:
+        for _ in range(runs):
+            yield json.loads(json.dumps(answers_static))  # deep copy simple
+        return
+    left = runs
+    while left > 0:
+        n = min(ANSWER_CHUNK, left)
+        yield from build_prob_answers_batch(n)
+        left -= n
 
-def run_many(url: str, runs: int = 110, headless: bool = False, slowmo: int = 120, answers_static: Dict[str, Any] | None = None, jitter_s: float = 0.8):
+async def run_many(url: str, runs: int = 110, headless: bool = False, slowmo: int = 0, answers_static: Dict[str, Any] | None = None, jitter_s: float = 0.8, concurrency: int = 1, pool_size: int = POOL_SIZE, answer_files: Sequence[Path] | None = None):
     """
-    - Abre un navegador.
+    - Abre un pool de hasta 'pool_size' navegadores (ver open_session).
     - Repite 'runs' veces creando un contexto/pestaña nuevo.
+    - 'concurrency' workers sacan respuestas de una cola y envían a la vez
+      (contextos aislados repartidos entre los navegadores del pool).
     - Si 'answers_static' es None, genera nuevas respuestas en cada vuelta.
+    - Con 'answer_files' se hace un envío por archivo JSON (ignora 'runs').
     - 'jitter_s' añade un pequeño sleep aleatorio entre iteraciones.
     """
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=headless, slow_mo=slowmo)
-        for i in range(1, runs + 1):
-            ctx = browser.new_context(viewport={"width": 1440, "height": 900})
-            page = ctx.new_page()
-            try:
-                if answers_static is None:
-                    answers = build_prob_answers()
-                else:
-                    answers = json.loads(json.dumps(answers_static))  # deep copy simple
-                answers["_url"] = url
-
-                _log(f"Iteración {i}/{runs}: llenando y enviando…")
-                _fill_and_submit(page, answers)
-                _log(f"Iteración {i}/{runs}: enviada ✅")
-            except Exception as e:
-                _log(f"Iteración {i}/{runs}: ERROR -> {e}")
-            finally:
-                page.close()
-                ctx.close()
-                # pequeño respiro aleatorio para no spamear al servidor
-                time.sleep(random.uniform(0.2, jitter_s))
-        browser.close()
+    if answer_files is not None:
+        runs = len(answer_files)
+    _SCALE_LAYOUT.clear()
+    workers = max(1, min(concurrency, runs))
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2 * workers)
+
+    async def producer():
+        for i, answers in enumerate(iter_answers(runs, answers_static, answer_files), start=1):
+            await queue.put((i, answers))
+        for _ in range(workers):
+            await queue.put(None)
+
+    # El productor empieza a llenar la cola mientras arranca Chromium.
+    prod = asyncio.create_task(producer())
+    try:
+        p, pool = await open_session(headless=headless, slowmo=slowmo, pool_size=pool_size)
+    except BaseException:
+        prod.cancel()
+        raise
+
+    async def worker():
+        while (item := await queue.get()) is not None:
+            i, answers = item
+            await run_bot_async(pool, url, i, runs, answers, jitter_s)
+
+    try:
+        await asyncio.gather(prod, *(worker() for _ in range(workers)))
+    finally:
+        prod.cancel()
+        await close_session(p, pool)
 
 # ============================================================
 # CLI
 # ============================================================
 
+# slow_mo solo para ver los clics; en uso normal el auto-wait de Playwright y la
+# espera de la primera pregunta de cada página bastan.
+DEBUG_SLOWMO_MS = 120
+
+def _parse_viewport(value: str) -> Dict[str, int]:
+    m = re.fullmatch(r"\s*(\d+)\s*[xX]\s*(\d+)\s*", value)
+    if not m or not all(int(g) > 0 for g in m.groups()):
+        raise argparse.ArgumentTypeError(f"Viewport inválido '{value}' (usa ANCHOxALTO, p. ej. 1280x720)")
+    return {"width": int(m.group(1)), "height": int(m.group(2))}
+
 def main():
     ap = argparse.ArgumentParser(description="Google Forms bot visible, sin capturas y con múltiples envíos.")
     ap.add_argument("--url", required=False, help="URL de vista del formulario (viewform)")
-    ap.add_argument("--answers", default=None, help="Archivo JSON con respuestas (si no quieres probabilidades)")
+    src = ap.add_mutually_exclusive_group()
+    src.add_argument("--answers", default=None, help="Archivo JSON con respuestas (si no quieres probabilidades)")
+    src.add_argument("--answers-dir", default=None, help="Carpeta con un JSON de respuestas por envío (*.json; ignora --runs)")
     ap.add_argument("--seed", type=int, default=None, help="Semilla para aleatoriedad reproducible")
-    ap.add_argument("--slowmo", type=int, default=120, help="Milisegundos de retardo por acción (default 120)")
+    ap.add_argument("--slowmo", type=int, default=0, help="Milisegundos de retardo por acción (default 0)")
+    ap.add_argument("--debug", action="store_true", help=f"Depuración visual: slowmo de {DEBUG_SLOWMO_MS} ms si no se indica --slowmo")
     ap.add_argument("--headless", action="store_true", help="Ejecuta en modo headless (por defecto visible)")
-    ap.add_argument("--runs", type=int, default=110, help="Número de envíos a realizar (default 110)")
+    ap.add_argument("--viewport", type=_parse_viewport, default=None, help="Tamaño de ventana ANCHOxALTO (default 1280x720, 800x600 en headless)")
+    ap.add_argument("--runs", "--count", dest="runs", type=int, default=110, help="Número de envíos a realizar (default 110)")
+    ap.add_argument("--human-ms", type=int, default=0, help="Pausa en ms entre clics para simular a una persona (default 0)")
+    ap.add_argument("--lean", action="store_true", help="Bloquea también CSS y telemetría (carga más ligera)")
+    ap.add_argument("--strict-wait", action="store_true", help="Espera también networkidle en cada página (más lento)")
+    ap.add_argument("--concurrency", type=int, default=1, help="Envíos simultáneos (contextos a la vez; default 1)")
+    ap.add_argument("--pool-size", type=int, default=POOL_SIZE, help=f"Máximo de navegadores Chromium reutilizados (default {POOL_SIZE})")
     args = ap.parse_args()
 
     url = args.url or input("Pega la URL del formulario (viewform): ").strip()
@@ -405,6 +907,14 @@ def main():
     if args.seed is not None:
         random.seed(args.seed)
 
+    slowmo = args.slowmo or (DEBUG_SLOWMO_MS if args.debug else 0)
+
+    global HUMAN_DELAY_MS, LEAN_MODE, VIEWPORT, STRICT_WAIT
+    HUMAN_DELAY_MS = max(0, args.human_ms)
+    LEAN_MODE = args.lean
+    STRICT_WAIT = args.strict_wait
+    VIEWPORT = args.viewport or (HEADLESS_VIEWPORT if args.headless else HEADFUL_VIEWPORT)
+
     answers_static = None
     if args.answers:
         pth = Path(args.answers)
@@ -414,9 +924,16 @@ def main():
                 print("[bot] No hay archivo de respuestas. Saliendo.")
                 return
             pth = Path(alt)
-        answers_static = json.loads(pth.read_text(encoding="utf-8"))
+        answers_static = _load_json(pth)
+
+    answer_files = None
+    if args.answers_dir:
+        answer_files = sorted(Path(args.answers_dir).glob("*.json"))
+        if not answer_files:
+            print(f"[bot] No hay archivos *.json en '{args.answers_dir}'. Saliendo.")
+            return
 
-    run_many(url=url, runs=args.runs, headless=args.headless, slowmo=args.slowmo, answers_static=answers_static)
+    asyncio.run(run_many(url=url, runs=args.runs, headless=args.headless, slowmo=slowmo, answers_static=answers_static, concurrency=args.concurrency, pool_size=args.pool_size, answer_files=answer_files))
 
 if __name__ == "__main__":
     main()